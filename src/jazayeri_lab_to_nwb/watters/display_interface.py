@@ -2,7 +2,7 @@
 
 import itertools
 import json
-from pathlib import Path
+import operator
 from typing import Optional
 
 import numpy as np
@@ -12,6 +12,7 @@ from neuroconv.datainterfaces.text.timeintervalsinterface import (
 )
 from neuroconv.utils import FolderPathType
 from pynwb import NWBFile
+from utils import dataframe_to_time_intervals, load_trials
 
 
 class DisplayInterface(TimeIntervalsInterface):
@@ -29,6 +30,27 @@ class DisplayInterface(TimeIntervalsInterface):
         "frame_display_times": "start_time",
     }
 
+    COLUMN_DESCRIPTIONS = {
+        "object_positions": (
+            "For each frame, a serialized list with one element for each "
+            "object. Each element is an (x, y) position of the "
+            "corresponding object, in coordinates of arena width."
+        ),
+        "fixation_cross_scale": (
+            "For each frame, the scale of the central fixation cross. "
+            "Fixation cross scale grows as the eye position deviates from "
+            "the center of the fixation cross, to provide a cue to "
+            "maintain good fixation."
+        ),
+        "closed_loop_eye_position": (
+            "For each frame, the eye position in the close-loop task "
+            "engine. This was used to for real-time eye position "
+            "computations, such as saccade detection and reward delivery."
+        ),
+        "task_phase": "The phase of the task for each frame.",
+        "start_time": "Time of display update for each frame.",
+    }
+
     def __init__(self, folder_path: FolderPathType, verbose: bool = True):
         super().__init__(file_path=folder_path, verbose=verbose)
 
@@ -52,9 +74,13 @@ class DisplayInterface(TimeIntervalsInterface):
 
     def _read_file(self, file_path: FolderPathType):
         # Create dataframe with data for each frame
-        trials = json.load(open(Path(file_path) / "trials.json", "r"))
+        trials = load_trials(file_path)
         frames = {
-            k_mapped: list(itertools.chain(*[d[k] for d in trials]))
+            k_mapped: list(
+                itertools.chain.from_iterable(
+                    map(operator.itemgetter(k), trials)
+                )
+            )
             for k, k_mapped in DisplayInterface.KEY_MAP.items()
         }
 
@@ -71,34 +97,16 @@ class DisplayInterface(TimeIntervalsInterface):
         metadata: Optional[dict] = None,
         tag: str = "display",
     ):
-        return super(DisplayInterface, self).add_to_nwbfile(
-            nwbfile=nwbfile,
-            metadata=metadata,
-            tag=tag,
+        metadata = metadata or self.get_metadata()
+        self.time_intervals = dataframe_to_time_intervals(
+            self.dataframe,
             column_descriptions=self.column_descriptions,
+            **metadata["TimeIntervals"][tag],
         )
+        nwbfile.add_time_intervals(self.time_intervals)
+
+        return nwbfile
 
     @property
     def column_descriptions(self):
-        column_descriptions = {
-            "object_positions": (
-                "For each frame, a serialized list with one element for each "
-                "object. Each element is an (x, y) position of the "
-                "corresponding object, in coordinates of arena width."
-            ),
-            "fixation_cross_scale": (
-                "For each frame, the scale of the central fixation cross. "
-                "Fixation cross scale grows as the eye position deviates from "
-                "the center of the fixation cross, to provide a cue to "
-                "maintain good fixation."
-            ),
-            "closed_loop_eye_position": (
-                "For each frame, the eye position in the close-loop task "
-                "engine. This was used to for real-time eye position "
-                "computations, such as saccade detection and reward delivery."
-            ),
-            "task_phase": "The phase of the task for each frame.",
-            "start_time": "Time of display update for each frame.",
-        }
-
-        return column_descriptions
+        return DisplayInterface.COLUMN_DESCRIPTIONS
@@ -20,6 +20,7 @@ Usage:
     See comments below for descriptions of these variables.
 """
 
+import collections
 import glob
 import json
 import logging
@@ -179,12 +180,15 @@ def _update_metadata(metadata, subject, session_id, session_paths):
     probe_metadata_file = (
         session_paths.data_open_source / "probes.metadata.json"
     )
-    probe_metadata = json.load(open(probe_metadata_file, "r"))
+    with open(probe_metadata_file, "r") as f:
+        probe_metadata = json.load(f)
+    # Group probe metadata by probe type, keeping the order within each type
+    probe_metadata_by_type = collections.defaultdict(list)
+    for x in probe_metadata:
+        probe_metadata_by_type[x["probe_type"]].append(x)
     for entry in metadata["Ecephys"]["ElectrodeGroup"]:
         if entry["device"] == "Neuropixel-Imec":
-            neuropixel_metadata = [
-                x for x in probe_metadata if x["probe_type"] == "Neuropixels"
-            ][0]
+            neuropixel_metadata = probe_metadata_by_type["Neuropixels"][0]
             coordinate_system = neuropixel_metadata["coordinate_system"]
             coordinates = neuropixel_metadata["coordinates"]
             depth_from_surface = neuropixel_metadata["depth_from_surface"]
@@ -201,9 +205,9 @@ def _update_metadata(metadata, subject, session_id, session_paths):
             ]
         elif "vprobe" in entry["device"]:
             probe_index = int(entry["device"].split("vprobe")[1])
-            v_probe_metadata = [
-                x for x in probe_metadata if x["probe_type"] == "V-Probe 64"
-            ][probe_index]
+            v_probe_metadata = probe_metadata_by_type["V-Probe 64"][
+                probe_index
+            ]
             first_channel = v_probe_metadata["coordinates"]["first_channel"]
             last_channel = v_probe_metadata["coordinates"]["last_channel"]
             coordinate_system = v_probe_metadata["coordinate_system"]
@@ -15,7 +15,9 @@ from neuroconv.datainterfaces.ecephys.basesortingextractorinterface import (
 )
 from neuroconv.utils import FolderPathType
 from recording_interface import DatRecordingInterface
-from spikeinterface import curation
+from spikeinterface.curation.remove_excess_spikes import (
+    RemoveExcessSpikesSorting,
+)
 
 
 def _trim_excess_spikes(
@@ -58,15 +60,100 @@ def _trim_excess_spikes(
 
     if has_exceeding_spikes:
         # Sometimes kilosort can detect spike that happen very
-        # slightly after the recording stopped
-        sorting_interface.sorting_extractor = curation.remove_excess_spikes(
-            recording=recording_extractor,
+        # slightly after the recording stopped. Wrap the sorting directly
+        # rather than via curation.remove_excess_spikes, which would scan the
+        # spike vector again to detect the excess spikes found above. The
+        # wrapper lazily truncates each spike train at the recording end.
+        sorting_interface.sorting_extractor = RemoveExcessSpikesSorting(
             sorting=sorting_extractor,
+            recording=recording_extractor,
         )
 
     return
 
 
+def _affine_transform(timestamps, coef, offset, out=None):
+    """Compute coef * timestamps + offset with a single output allocation.
+
+    Args:
+        timestamps: Float array. Timestamps to transform.
+        coef: Float. Multiplicative coefficient of the transform.
+        offset: Float. Additive offset of the transform.
+        out: Optional float array of the same shape as timestamps. If given,
+            the result is written into it, which may be timestamps itself.
+
+    Returns:
+        Float array of transformed timestamps.
+    """
+    out = np.multiply(timestamps, coef, out=out)
+    out += offset
+    return out
+
+
+def _load_transform(sync_dir, stream):
+    """Load the transform from a physiology stream's timescale to mworks.
+
+    Args:
+        sync_dir: Path. Directory containing sync pulse data.
+        stream: String. Physiology stream, either 'open_ephys' or 'spikeglx'.
+
+    Returns:
+        Tuple (coef, offset) such that aligned = coef * timestamps + offset.
+    """
+    if stream == "open_ephys":
+        # Open Ephys timestamps are relative to the recording start time
+        start_path = sync_dir / stream / "recording_start_time"
+        with open(start_path, "r") as f:
+            start = float(f.read().strip())
+    else:
+        start = 0.0
+    with open(sync_dir / stream / "transform", "r") as f:
+        transform = json.load(f)
+    coef = transform["coef"]
+    offset = transform["intercept"] + coef * start
+    return coef, offset
+
+
+def _get_original_timestamps(recording_interface):
+    """Get original timestamps of a recording interface as a fresh array.
+
+    If the recording has no time vector, its timestamps are implicitly uniform
+    and are generated from the sampling frequency of the existing extractor
+    instead of re-instantiating the extractor from source data.
+
+    Args:
+        recording_interface: BaseRecordingExtractorInterface instance. Must
+            not have been temporally aligned yet.
+
+    Returns:
+        Float array of original timestamps, safe to modify in place.
+    """
+    recording_extractor = recording_interface.recording_extractor
+    if recording_extractor.has_time_vector():
+        return recording_interface.get_original_timestamps()
+    return recording_extractor.get_times()
+
+
+def _get_aligned_start_time(data_interface, transform=None):
+    """Get the first timestamp of a data interface in the aligned timescale.
+
+    Args:
+        data_interface: BaseDataInterface instance.
+        transform: Optional tuple (coef, offset) of a timescale transform not
+            yet applied to the data interface, which must then be a recording
+            interface. Its first timestamp is computed without materializing
+            the timestamps of the recording.
+
+    Returns:
+        Float first timestamp.
+    """
+    if transform is None:
+        return data_interface.get_timestamps()[0]
+    coef, offset = transform
+    recording_extractor = data_interface.recording_extractor
+    return coef * recording_extractor.sample_index_to_time(0) + offset
+
+
 class NWBConverter(neuroconv.NWBConverter):
     """Primary conversion class for extracellular electrophysiology dataset."""
 
@@ -106,7 +193,7 @@ class NWBConverter(neuroconv.NWBConverter):
                 )
                 data_interface.sorting_extractor.set_property(
                     key="probe",
-                    values=len(unit_ids) * [name.split("Sorting")[1]],
+                    values=np.full(len(unit_ids), name.split("Sorting")[1]),
                 )
                 unit_name_start += np.max(unit_ids) + 1
 
@@ -116,49 +203,38 @@ class NWBConverter(neuroconv.NWBConverter):
         if self.sync_dir is None:
             return
         sync_dir = Path(self.sync_dir)
+        data_interfaces = self.data_interface_objects
+
+        # Timescale transforms, loaded once per sync stream and shared by all
+        # probes recorded in that stream
+        transforms = {}
 
-        # Align each recording
-        for name, recording_interface in self.data_interface_objects.items():
+        # Get the timescale transform of each recording. These are applied
+        # below together with the zero time, so that timestamps of each
+        # recording are written only once.
+        recording_transforms = {}
+        for name, recording_interface in data_interfaces.items():
             if "Recording" not in name:
                 continue
             probe_name = name.split("Recording")[1]
 
-            # Load timescale transform
+            # Get timescale transform
             if "VP" in probe_name:
-                start_path = sync_dir / "open_ephys" / "recording_start_time"
-                start = float(open(start_path).read().strip())
-                transform_path = sync_dir / "open_ephys" / "transform"
-                transform = json.load(open(transform_path, "r"))
-                lf_interface = None
+                stream = "open_ephys"
             elif "NP" in probe_name:
-                start = 0.0
-                transform_path = sync_dir / "spikeglx" / "transform"
-                transform = json.load(open(transform_path, "r"))
-                lf_interface = self.data_interface_objects["LF"]
+                stream = "spikeglx"
             else:
-                raise ValueError("Invalid probe_name {probe_name}")
-            intercept = transform["intercept"]
-            coef = transform["coef"]
-
-            # Align recording timestamps
-            orig_timestamps = recording_interface.get_original_timestamps()
-            aligned_timestamps = intercept + coef * (start + orig_timestamps)
-            recording_interface.set_aligned_timestamps(aligned_timestamps)
-
-            # Align LFP timestamps
-            if lf_interface is not None:
-                orig_timestamps = lf_interface.get_original_timestamps()
-                aligned_timestamps = intercept + coef * (
-                    start + orig_timestamps
-                )
-                lf_interface.set_aligned_timestamps(aligned_timestamps)
+                raise ValueError(f"Invalid probe_name {probe_name}")
+            if stream not in transforms:
+                transforms[stream] = _load_transform(sync_dir, stream)
+            recording_transforms[name] = transforms[stream]
+            if stream == "spikeglx":
+                # LFP is recorded in the same stream as the Neuropixel
+                recording_transforms["LF"] = transforms[stream]
 
             # If sorting exists, register recording to it
-            if f"Sorting{probe_name}" in self.data_interface_objects:
-                sorting_interface = self.data_interface_objects[
-                    f"Sorting{probe_name}"
-                ]
-
+            sorting_interface = data_interfaces.get(f"Sorting{probe_name}")
+            if sorting_interface is not None:
                 # Trim sorted spikes that occur after recording ends from
                 # kilosort artifacts
                 _trim_excess_spikes(
@@ -169,16 +245,32 @@ class NWBConverter(neuroconv.NWBConverter):
                 # Register recording
                 sorting_interface.register_recording(recording_interface)
 
-        # Align so that 0 is the first of all timestamps
-        aligned_start_times = []
-        for data_interface in self.data_interface_objects.values():
-            start_time = data_interface.get_timestamps()[0]
-            aligned_start_times.append(start_time)
-        zero_time = -1.0 * min(aligned_start_times)
-        for data_interface in self.data_interface_objects.values():
+        # Align so that 0 is the first of all timestamps. Sorting interfaces
+        # are skipped because their timestamps are those of their recording.
+        zero_time = -1.0 * min(
+            _get_aligned_start_time(
+                data_interface, transform=recording_transforms.get(name)
+            )
+            for name, data_interface in data_interfaces.items()
+            if not isinstance(data_interface, BaseSortingExtractorInterface)
+        )
+        for name, data_interface in data_interfaces.items():
             if isinstance(data_interface, BaseSortingExtractorInterface):
                 # Do not need to align because recording will be aligned
                 continue
-            start_time = data_interface.set_aligned_starting_time(
-                aligned_starting_time=zero_time
+            if name not in recording_transforms:
+                data_interface.set_aligned_starting_time(
+                    aligned_starting_time=zero_time
+                )
+                continue
+
+            # Apply timescale transform and zero time in a single pass
+            coef, offset = recording_transforms[name]
+            timestamps = _get_original_timestamps(data_interface)
+            _affine_transform(
+                timestamps,
+                coef=coef,
+                offset=offset + zero_time,
+                out=timestamps,
             )
+            data_interface.set_aligned_timestamps(timestamps)
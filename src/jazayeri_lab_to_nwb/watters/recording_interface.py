@@ -1,5 +1,7 @@
 """Primary class for recording V-Probe data from .dat files."""
 
+import copy
+import functools
 from typing import Optional
 
 import numpy as np
@@ -10,6 +12,17 @@ from neuroconv.datainterfaces.ecephys.baserecordingextractorinterface import (
 from neuroconv.utils import FilePathType
 
 
+@functools.lru_cache(maxsize=None)
+def _linear_probe(num_elec: int, ypitch: float) -> probeinterface.Probe:
+    """Generate a linear probe geometry once per (num_elec, ypitch).
+
+    The cached probe must not be modified; use a copy of it instead.
+    """
+    return probeinterface.generate_linear_probe(
+        num_elec=num_elec, ypitch=ypitch
+    )
+
+
 class DatRecordingInterface(BaseRecordingExtractorInterface):
     ExtractorName = "BinaryRecordingExtractor"
 
@@ -48,9 +61,7 @@ class DatRecordingInterface(BaseRecordingExtractorInterface):
 
         # Generate V-probe geometry: 64 channels arranged vertically with 50 um
         # spacing
-        probe = probeinterface.generate_linear_probe(
-            num_elec=channel_count, ypitch=50
-        )
+        probe = copy.deepcopy(_linear_probe(num_elec=channel_count, ypitch=50))
         probe.set_device_channel_indices(np.arange(channel_count))
         probe.name = probe_name
 
@@ -60,7 +71,7 @@ class DatRecordingInterface(BaseRecordingExtractorInterface):
         # set group_name property to match electrode group name in metadata
         self.recording_extractor.set_property(
             key="group_name",
-            values=[probe_name] * len(self.recording_extractor.channel_ids),
+            values=np.full(channel_count, probe_name),
         )
 
     def get_metadata(self) -> dict:
@@ -48,15 +48,15 @@ class EyePositionInterface(TimestampsFromArrayInterface):
         folder_path = Path(folder_path)
         super().__init__(folder_path=folder_path)
 
-        # Find eye position files and check they all exist
+        # Find eye position files
         eye_h_file = folder_path / "eye_h_calibrated.json"
         eye_v_file = folder_path / "eye_v_calibrated.json"
-        assert eye_h_file.exists(), f"Could not find {eye_h_file}"
-        assert eye_v_file.exists(), f"Could not find {eye_v_file}"
 
         # Load eye data
-        eye_h_data = json.load(open(eye_h_file, "r"))
-        eye_v_data = json.load(open(eye_v_file, "r"))
+        with open(eye_h_file, "r") as f:
+            eye_h_data = json.load(f)
+        with open(eye_v_file, "r") as f:
+            eye_v_data = json.load(f)
         eye_h_times = np.array(eye_h_data["times"])
         eye_h_values = 0.5 + (np.array(eye_h_data["values"]) / 20)
         eye_v_times = np.array(eye_v_data["times"])
@@ -113,10 +113,10 @@ class PupilSizeInterface(TimestampsFromArrayInterface):
         # Find pupil size file
         folder_path = Path(folder_path)
         pupil_size_file = folder_path / "pupil_size_r.json"
-        assert pupil_size_file.exists(), f"Could not find {pupil_size_file}"
 
         # Load pupil size data and set data attributes
-        pupil_size_data = json.load(open(pupil_size_file, "r"))
+        with open(pupil_size_file, "r") as f:
+            pupil_size_data = json.load(f)
         self.set_original_timestamps(np.array(pupil_size_data["times"]))
         self._pupil_size = np.array(pupil_size_data["values"])
 
@@ -154,10 +154,10 @@ class RewardLineInterface(TimestampsFromArrayInterface):
         # Find reward line file
         folder_path = Path(folder_path)
         reward_line_file = folder_path / "reward_line.json"
-        assert reward_line_file.exists(), f"Could not find {reward_line_file}"
 
         # Load reward line data and set data attributes
-        reward_line_data = json.load(open(reward_line_file, "r"))
+        with open(reward_line_file, "r") as f:
+            reward_line_data = json.load(f)
         self.set_original_timestamps(np.array(reward_line_data["times"]))
         self._reward_line = reward_line_data["values"]
 
@@ -198,10 +198,10 @@ class AudioInterface(TimestampsFromArrayInterface):
         # Find sound file
         folder_path = Path(folder_path)
         sound_file = folder_path / "sound.json"
-        assert sound_file.exists(), f"Could not find {sound_file}"
 
         # Load sound data and set data attributes
-        sound_data = json.load(open(sound_file, "r"))
+        with open(sound_file, "r") as f:
+            sound_data = json.load(f)
         self.set_original_timestamps(np.array(sound_data["times"]))
         audio = np.array(sound_data["values"])
 
@@ -1,7 +1,7 @@
 """Class for converting trial-structured data."""
 
 import json
-from pathlib import Path
+import operator
 from typing import Optional
 
 import numpy as np
@@ -11,6 +11,7 @@ from neuroconv.datainterfaces.text.timeintervalsinterface import (
 )
 from neuroconv.utils import FolderPathType
 from pynwb import NWBFile
+from utils import dataframe_to_time_intervals, load_trials
 
 
 class TrialsInterface(TimeIntervalsInterface):
@@ -44,6 +45,99 @@ class TrialsInterface(TimeIntervalsInterface):
         "response_time": "response_time",
     }
 
+    TIME_COLUMNS = [
+        "closed_loop_response_time",
+        "start_time",
+        "phase_fixation_time",
+        "phase_stimulus_time",
+        "phase_delay_time",
+        "phase_cue_time",
+        "phase_response_time",
+        "phase_reveal_time",
+        "phase_iti_time",
+        "reward_time",
+        "response_time",
+    ]
+
+    COLUMN_DESCRIPTIONS = {
+        "background_indices": (
+            "For each trial, the indices of the background noise pattern "
+            "patch."
+        ),
+        "broke_fixation": (
+            "For each trial, whether the subject broke fixation and the "
+            "trial was aborted"
+        ),
+        "stimulus_object_identities": (
+            "For each trial, a serialized list with one element for each "
+            'object. Each element is the identity symbol (e.g. "a", "b", '
+            '"c", ...) of the corresponding object.'
+        ),
+        "stimulus_object_positions": (
+            "For each trial, a serialized list with one element for each "
+            "object. Each element is the initial (x, y) position of the "
+            "corresponding object, in coordinates of arena width."
+        ),
+        "stimulus_object_velocities": (
+            "For each trial, a serialized list with one element for each "
+            "object. Each element is the initial (dx/dt, dy/dt) velocity "
+            "of the corresponding object, in units of arena width per "
+            "display update."
+        ),
+        "stimulus_object_target": (
+            "For each trial, a serialized list with one element for each "
+            "object. Each element is a boolean indicating whether the "
+            "corresponding object is ultimately the cued target."
+        ),
+        "delay_object_blanks": (
+            "For each trial, a boolean indicating whether the objects were "
+            "rendered as blank discs during the delay phase."
+        ),
+        "closed_loop_response_position": (
+            "For each trial, the position of the response saccade used by "
+            "the closed-loop game engine. This is used for determining "
+            "reward."
+        ),
+        "closed_loop_response_time": (
+            "For each trial, the time of the response saccade used by "
+            "the closed-loop game engine. This is used for the timing of "
+            "reward delivery."
+        ),
+        "start_time": "Start time of each trial.",
+        "phase_fixation_time": (
+            "Time of fixation phase onset for each trial."
+        ),
+        "phase_stimulus_time": (
+            "Time of stimulus phase onset for each trial."
+        ),
+        "phase_delay_time": "Time of delay phase onset for each trial.",
+        "phase_cue_time": "Time of cue phase onset for each trial.",
+        "phase_response_time": (
+            "Time of response phase onset for each trial."
+        ),
+        "phase_reveal_time": "Time of reveal phase onset for each trial.",
+        "phase_iti_time": (
+            "Time of inter-trial interval onset for each trial."
+        ),
+        "reward_time": "Time of reward delivery onset for each trial.",
+        "reward_duration": "Reward duration for each trial",
+        "response_position": (
+            "Response position for each trial. This differs from "
+            "closed_loop_response_position in that this is calculated "
+            "post-hoc from high-resolution eye tracking data, hence is "
+            "more accurate. Note that unlike "
+            "closed_loop_response_position, this may be inconsistent with "
+            "reward delivery."
+        ),
+        "response_time": (
+            "Response time for each trial. This differs from "
+            "closed_loop_response_time in that this is calculated post-hoc "
+            "from high-resolution eye tracking data, hence is more "
+            "accurate. Note that unlike closed_loop_response_time, this "
+            "may be inconsistent with reward delivery."
+        ),
+    }
+
     def __init__(self, folder_path: FolderPathType, verbose: bool = True):
         super().__init__(file_path=folder_path, verbose=verbose)
 
@@ -61,23 +155,14 @@ class TrialsInterface(TimeIntervalsInterface):
         return super(TrialsInterface, self).get_timestamps(column="start_time")
 
     def set_aligned_starting_time(self, aligned_starting_time: float) -> None:
-        self.dataframe.closed_loop_response_time += aligned_starting_time
-        self.dataframe.start_time += aligned_starting_time
-        self.dataframe.phase_fixation_time += aligned_starting_time
-        self.dataframe.phase_stimulus_time += aligned_starting_time
-        self.dataframe.phase_delay_time += aligned_starting_time
-        self.dataframe.phase_cue_time += aligned_starting_time
-        self.dataframe.phase_response_time += aligned_starting_time
-        self.dataframe.phase_reveal_time += aligned_starting_time
-        self.dataframe.phase_iti_time += aligned_starting_time
-        self.dataframe.reward_time += aligned_starting_time
-        self.dataframe.response_time += aligned_starting_time
+        # Shift all time columns in a single vectorized operation
+        self.dataframe[TrialsInterface.TIME_COLUMNS] += aligned_starting_time
 
     def _read_file(self, file_path: FolderPathType):
         # Create dataframe with data for each trial
-        trials = json.load(open(Path(file_path) / "trials.json", "r"))
+        trials = load_trials(file_path)
         trials = {
-            k_mapped: [d[k] for d in trials]
+            k_mapped: list(map(operator.itemgetter(k), trials))
             for k, k_mapped in TrialsInterface.KEY_MAP.items()
         }
 
@@ -105,92 +190,16 @@ class TrialsInterface(TimeIntervalsInterface):
         metadata: Optional[dict] = None,
         tag: str = "trials",
     ):
-        return super(TrialsInterface, self).add_to_nwbfile(
-            nwbfile=nwbfile,
-            metadata=metadata,
-            tag=tag,
+        metadata = metadata or self.get_metadata()
+        self.time_intervals = dataframe_to_time_intervals(
+            self.dataframe,
             column_descriptions=self.column_descriptions,
+            **metadata["TimeIntervals"][tag],
         )
+        nwbfile.add_time_intervals(self.time_intervals)
+
+        return nwbfile
 
     @property
     def column_descriptions(self):
-        column_descriptions = {
-            "background_indices": (
-                "For each trial, the indices of the background noise pattern "
-                "patch."
-            ),
-            "broke_fixation": (
-                "For each trial, whether the subject broke fixation and the "
-                "trial was aborted"
-            ),
-            "stimulus_object_identities": (
-                "For each trial, a serialized list with one element for each "
-                'object. Each element is the identity symbol (e.g. "a", "b", '
-                '"c", ...) of the corresponding object.'
-            ),
-            "stimulus_object_positions": (
-                "For each trial, a serialized list with one element for each "
-                "object. Each element is the initial (x, y) position of the "
-                "corresponding object, in coordinates of arena width."
-            ),
-            "stimulus_object_velocities": (
-                "For each trial, a serialized list with one element for each "
-                "object. Each element is the initial (dx/dt, dy/dt) velocity "
-                "of the corresponding object, in units of arena width per "
-                "display update."
-            ),
-            "stimulus_object_target": (
-                "For each trial, a serialized list with one element for each "
-                "object. Each element is a boolean indicating whether the "
-                "corresponding object is ultimately the cued target."
-            ),
-            "delay_object_blanks": (
-                "For each trial, a boolean indicating whether the objects were "
-                "rendered as blank discs during the delay phase."
-            ),
-            "closed_loop_response_position": (
-                "For each trial, the position of the response saccade used by "
-                "the closed-loop game engine. This is used for determining "
-                "reward."
-            ),
-            "closed_loop_response_time": (
-                "For each trial, the time of the response saccade used by "
-                "the closed-loop game engine. This is used for the timing of "
-                "reward delivery."
-            ),
-            "start_time": "Start time of each trial.",
-            "phase_fixation_time": (
-                "Time of fixation phase onset for each trial."
-            ),
-            "phase_stimulus_time": (
-                "Time of stimulus phase onset for each trial."
-            ),
-            "phase_delay_time": "Time of delay phase onset for each trial.",
-            "phase_cue_time": "Time of cue phase onset for each trial.",
-            "phase_response_time": (
-                "Time of response phase onset for each trial."
-            ),
-            "phase_reveal_time": "Time of reveal phase onset for each trial.",
-            "phase_iti_time": (
-                "Time of inter-trial interval onset for each trial."
-            ),
-            "reward_time": "Time of reward delivery onset for each trial.",
-            "reward_duration": "Reward duration for each trial",
-            "response_position": (
-                "Response position for each trial. This differs from "
-                "closed_loop_response_position in that this is calculated "
-                "post-hoc from high-resolution eye tracking data, hence is "
-                "more accurate. Note that unlike "
-                "closed_loop_response_position, this may be inconsistent with "
-                "reward delivery."
-            ),
-            "response_time": (
-                "Response time for each trial. This differs from "
-                "closed_loop_response_time in that this is calculated post-hoc "
-                "from high-resolution eye tracking data, hence is more "
-                "accurate. Note that unlike closed_loop_response_time, this "
-                "may be inconsistent with reward delivery."
-            ),
-        }
-
-        return column_descriptions
+        return TrialsInterface.COLUMN_DESCRIPTIONS
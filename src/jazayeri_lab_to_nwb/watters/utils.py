@@ -0,0 +1,102 @@
+"""Helpers shared by the trials and display interfaces."""
+
+import functools
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from hdmf.common import VectorData
+from neuroconv.utils import FolderPathType
+from pynwb.epoch import TimeIntervals
+
+
+@functools.lru_cache(maxsize=1)
+def _load_trials_file(path: str, mtime_ns: int, size: int) -> list:
+    """Parse a trials.json file, caching the most recent result.
+
+    Args:
+        path: String. Path to trials.json.
+        mtime_ns: Int. Modification time of the file, used only as a cache
+            key so that a modified file is re-parsed.
+        size: Int. Size of the file in bytes, used only as a cache key.
+
+    Returns:
+        List of per-trial dictionaries. This object is shared by all callers.
+    """
+    del mtime_ns
+    del size
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def load_trials(folder_path: FolderPathType) -> list:
+    """Load the list of per-trial dictionaries in folder_path/trials.json.
+
+    The parsed file is cached so that the trials and display interfaces share
+    a single parse. Dataframes built from it hold references to its nested
+    lists (e.g. background_indices, response_position,
+    closed_loop_eye_position), so neither the returned list nor those
+    dataframe cells may be modified in place.
+
+    Args:
+        folder_path: Path. Directory containing trials.json.
+
+    Returns:
+        List of per-trial dictionaries, shared with the cache.
+    """
+    path = Path(folder_path) / "trials.json"
+    stat = path.stat()
+    return _load_trials_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def dataframe_to_time_intervals(
+    dataframe: pd.DataFrame,
+    table_name: str,
+    table_description: str,
+    column_descriptions: dict,
+) -> TimeIntervals:
+    """Convert a dataframe to a TimeIntervals table, column by column.
+
+    This produces the same table as neuroconv's convert_df_to_time_intervals,
+    but builds each column from all of its data at once instead of adding the
+    dataframe one row at a time.
+
+    Args:
+        dataframe: pd.DataFrame. Must have a start_time column. If it has no
+            stop_time column, one is added in place from the next start time.
+        table_name: String. Name of the TimeIntervals table.
+        table_description: String. Description of the TimeIntervals table.
+        column_descriptions: Dict. Maps column names to descriptions. Columns
+            not in it are described by their name.
+
+    Returns:
+        TimeIntervals table with start_time and stop_time first, followed by
+            the remaining dataframe columns in order.
+    """
+    # Like neuroconv, use next start times as stop times if there are none
+    if "stop_time" not in dataframe:
+        dataframe["stop_time"] = np.r_[
+            dataframe["start_time"][1:].to_numpy(), np.nan
+        ]
+
+    # Descriptions of start_time and stop_time are fixed by the NWB schema
+    column_descriptions = dict(
+        column_descriptions,
+        **{c["name"]: c["description"] for c in TimeIntervals.__columns__},
+    )
+    column_names = ["start_time", "stop_time"] + [
+        c for c in dataframe.columns if c not in ("start_time", "stop_time")
+    ]
+    columns = [
+        VectorData(
+            name=c,
+            description=column_descriptions.get(c, c),
+            data=dataframe[c].tolist(),
+        )
+        for c in column_names
+    ]
+
+    return TimeIntervals(
+        name=table_name, description=table_description, columns=columns
+    )